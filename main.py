@@ -1,9 +1,9 @@
+import atexit
 import logging
 import os
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
-
-from PyQt5.QtSvg import QSvgRenderer
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 
 CURRENT_VERSION = "4.0.1"
 CURRENT_VERSION_NAME = "Bosphorus"
@@ -13,11 +13,17 @@ AUTO_UPDATE_ENABLED = False
 
 cursorCustom = False
 
+# The log format never shows thread or process info, skip collecting it for every record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
 class Logger:
     def __init__(self, app_name):
         self.app_name = app_name
         self.logger = logging.getLogger(app_name)
         self.logger.setLevel(logging.DEBUG)
+        self.listener = None
         self.setup_logging()
 
     def get_log_path(self, filename):
@@ -30,19 +36,33 @@ class Logger:
             return os.path.join(os.path.dirname(os.path.abspath(__file__)), 'logs', filename)
 
     def setup_logging(self):
-        log_file = self.get_log_path('app.log')
-        log_dir = os.path.dirname(log_file)
-        os.makedirs(log_dir, exist_ok=True)
-
-        file_handler = RotatingFileHandler(log_file, maxBytes=1024 * 1024, backupCount=5)
-        console_handler = logging.StreamHandler()
+        # A re-import must not stack a second set of handlers on the same named logger
+        if self.logger.handlers:
+            return
+        self.logger.propagate = False
 
         formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        file_handler.setFormatter(formatter)
+
+        console_handler = logging.StreamHandler()
         console_handler.setFormatter(formatter)
+        handlers = [console_handler]
+
+        # The log file is opened on the first write, an unwritable log folder only loses the file output
+        log_file = self.get_log_path('app.log')
+        try:
+            os.makedirs(os.path.dirname(log_file), exist_ok=True)
+            file_handler = RotatingFileHandler(log_file, maxBytes=1024 * 1024, backupCount=5, delay=True)
+            file_handler.setFormatter(formatter)
+            handlers.append(file_handler)
+        except OSError:
+            pass
 
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
+        # Callers only enqueue records, formatting and writing happen on the listener thread
+        log_queue = queue.Queue(-1)
+        self.logger.addHandler(QueueHandler(log_queue))
+        self.listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        self.listener.start()
+        atexit.register(self.listener.stop)
 
     def get_logger(self):
         return self.logger
@@ -64,6 +84,7 @@ try:
     import random
     import json
     import math
+    import re
     import traceback
     import platform
     import pickle
@@ -71,16 +92,18 @@ try:
     import io
     import subprocess
     import tempfile
-    from urllib.request import urlretrieve
+    from functools import lru_cache
     import requests
     from packaging import version
 
     from PyQt5.QtCore import (Qt, QPoint, QPointF, QRectF, QLineF, pyqtSignal,
                               QObject, QSize, QTimer, QBuffer, QPropertyAnimation,
-                              QEasingCurve, QByteArray, QEventLoop, QParallelAnimationGroup, QEvent, QRect,pyqtProperty)
+                              QEasingCurve, QByteArray, QEventLoop, QParallelAnimationGroup, QEvent, QRect,pyqtProperty,
+                              QThread)
 
     from PyQt5.QtGui import (QPainter, QColor, QPen, QPixmap, QImage, QFont, QPalette, QIcon, QCursor, QFontDatabase,
-                             QLinearGradient, QRadialGradient, QRegion, QTransform, QPainterPath)
+                             QLinearGradient, QRadialGradient, QRegion, QTransform, QPainterPath, QStaticText,
+                             QPicture)
 
     from PyQt5.QtWidgets import (QApplication, QMainWindow, QLabel, QPushButton, QInputDialog,
                                  QVBoxLayout, QHBoxLayout, QWidget, QGraphicsScene, QGraphicsView,
@@ -91,6 +114,8 @@ try:
                                  QMessageBox, QGraphicsOpacityEffect, QSlider, QDialog, QComboBox, QGroupBox,
                                  QFormLayout, QStyleOptionSlider, QStyle, QButtonGroup, QRadioButton)
 
+    from PyQt5.QtSvg import QSvgRenderer
+
     app_logger.info("All modules imported successfully")
 
 
@@ -115,15 +140,48 @@ def deserialize_qt_object(obj):
     return obj
 
 
+# PyInstaller creates a temp folder and stores path in _MEIPASS, the base never changes while running
+RESOURCE_BASE_PATH = getattr(sys, '_MEIPASS', None) or os.path.abspath(".")
+
+
+@lru_cache(maxsize=None)
 def absolute_path(relative_path):
     """ Get absolute path to resource, works for dev and for PyInstaller """
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(".")
+    return os.path.join(RESOURCE_BASE_PATH, relative_path)
+
+
+@lru_cache(maxsize=32)
+def scaled_pixmap(relative_path, width, height):
+    """ Load and smooth-scale an image asset once, later calls share the cached pixmap """
+    return QPixmap(absolute_path(relative_path)).scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+
+@lru_cache(maxsize=32)
+def cached_icon(relative_path):
+    """ Load an icon asset once, buttons sharing an icon share its rasterized sizes """
+    return QIcon(absolute_path(relative_path))
+
+
+# Fetch threads that outlived their window, kept referenced until they finish
+detached_threads = []
+
+
+class JsonFetchThread(QThread):
+    fetched = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, url, parent=None, timeout=10):
+        super().__init__(parent)
+        self.url = url
+        self.timeout = timeout
 
-    return os.path.join(base_path, relative_path)
+    def run(self):
+        try:
+            response = requests.get(self.url, timeout=self.timeout)
+            response.raise_for_status()
+            self.fetched.emit(response.json())
+        except Exception as e:
+            self.failed.emit(str(e))
 
 
 class AnimatedModeIcon(QPushButton):
@@ -204,8 +262,9 @@ class CoolModeSwitch(QWidget):
         self._icon_to_draw = 'particle'  # New attribute to control which icon to draw
 
         # Load icons
-        self.pan_icon = QPixmap(absolute_path("assets/pan_icon.svg")).scaled(30, 30, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        self.particle_icon = QPixmap(absolute_path("assets/particle_icon.svg")).scaled(30, 30, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        self.pan_icon = scaled_pixmap("assets/pan_icon.svg", 30, 30)
+        self.particle_icon = scaled_pixmap("assets/particle_icon.svg", 30, 30)
+        self._bg_cache = None
 
         self.animation = QPropertyAnimation(self, b"handle_position", self)
         self.animation.setEasingCurve(QEasingCurve.InOutExpo)
@@ -221,8 +280,19 @@ class CoolModeSwitch(QWidget):
         self._handle_position = pos
         self.update()
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._bg_cache = None
+
+    def build_background(self):
+        # Track and both static icons only change with the size, the handle is drawn over them
+        # Rendered at the screen's device pixel ratio so the track stays crisp on HiDPI displays
+        ratio = self.devicePixelRatioF()
+        self._bg_cache = QPixmap(self.size() * ratio)
+        self._bg_cache.setDevicePixelRatio(ratio)
+        self._bg_cache.fill(Qt.transparent)
+
+        painter = QPainter(self._bg_cache)
         painter.setRenderHint(QPainter.Antialiasing)
 
         # Draw background
@@ -233,8 +303,19 @@ class CoolModeSwitch(QWidget):
         # Draw icons
         painter.drawPixmap(10, 5, self.pan_icon)
         painter.drawPixmap(60, 5, self.particle_icon)
+        painter.end()
+
+    def paintEvent(self, event):
+        # Rebuilt when missing or after the widget moved to a screen with a different pixel ratio
+        if self._bg_cache is None or self._bg_cache.devicePixelRatioF() != self.devicePixelRatioF():
+            self.build_background()
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.drawPixmap(0, 0, self._bg_cache)
 
         # Draw sliding handle
+        painter.setPen(Qt.NoPen)
         painter.setBrush(QColor(41, 128, 185))
         handle_rect = QRectF(self._handle_position, 0, 40, 40)
         painter.drawRoundedRect(handle_rect, 20, 20)
@@ -291,6 +372,12 @@ class ZoomSlider(QSlider):
             }
         """)
 
+        # Zoom text is laid out once per value and replayed on repaints
+        self.label_font = QFont(self.font())
+        self.label_font.setPointSize(8)
+        self._cached_zoom = None
+        self._cached_static = QStaticText()
+
     def paintEvent(self, event):
         super().paintEvent(event)
         painter = QPainter(self)
@@ -300,15 +387,54 @@ class ZoomSlider(QSlider):
         self.initStyleOption(opt)
 
         # Draw zoom percentage text
-        font = painter.font()
-        font.setPointSize(8)
-        painter.setFont(font)
+        painter.setFont(self.label_font)
         painter.setPen(Qt.white)
         zoom = self.value()
+        if zoom != self._cached_zoom:
+            self._cached_static.setText(f"{zoom}%")
+            self._cached_static.prepare(QTransform(), self.label_font)
+            self._cached_zoom = zoom
         rect = self.style().subControlRect(QStyle.CC_Slider, opt, QStyle.SC_SliderHandle, self)
-        painter.drawText(rect, Qt.AlignCenter, f"{zoom}%")
+        size = self._cached_static.size()
+        painter.drawStaticText(QPointF(rect.center().x() - size.width() / 2, rect.center().y() - size.height() / 2),
+                               self._cached_static)
+
+class FrogWidget(QWidget):
+    def __init__(self, svg_renderer, parent=None):
+        super().__init__(parent)
+        self.setFixedSize(30, 30)
+        self.svg_renderer = svg_renderer
+        self.angle = 0
+
+    def set_angle(self, angle):
+        self.angle = angle
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+
+        # Rotate around the center and scale based on rotation to create 3D illusion
+        scale = 0.5 + abs(math.sin(math.radians(self.angle))) * 0.5
+        painter.translate(self.width() / 2, self.height() / 2)
+        painter.rotate(self.angle)
+        painter.scale(scale, 1.0)
+
+        self.svg_renderer.render(painter, QRectF(-self.width() / 2, -self.height() / 2, self.width(), self.height()))
+
 
 class AboutDialog(QWidget):
+    # Registered once per process and shared by every dialog instance
+    _font_loaded = False
+    _frog_svg = None
+
+    @classmethod
+    def _ensure_assets(cls):
+        if not cls._font_loaded:
+            QFontDatabase.addApplicationFont(absolute_path("assets/Roboto-Light.ttf"))
+            cls._font_loaded = True
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.Dialog)
@@ -322,12 +448,11 @@ class AboutDialog(QWidget):
         layout.setContentsMargins(40, 40, 40, 40)
 
         # Load custom font
-        QFontDatabase.addApplicationFont(absolute_path("assets/Roboto-Light.ttf"))
+        self._ensure_assets()
 
         # Logo
         logo_label = QLabel()
-        logo_pixmap = QPixmap(absolute_path("assets/phase_logo_v3.svg"))
-        logo_label.setPixmap(logo_pixmap.scaled(200, 200, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        logo_label.setPixmap(scaled_pixmap("assets/phase_logo_v3.svg", 200, 200))
         logo_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(logo_label)
 
@@ -347,8 +472,7 @@ class AboutDialog(QWidget):
 
         # VX Logo
         vx_logo = QLabel()
-        vx_logo_pixmap = QPixmap(absolute_path("assets/vx_logo.svg"))
-        vx_logo.setPixmap(vx_logo_pixmap.scaled(140, 56, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        vx_logo.setPixmap(scaled_pixmap("assets/vx_logo.svg", 140, 56))
         vx_logo.setAlignment(Qt.AlignCenter)
         layout.addWidget(vx_logo)
 
@@ -376,20 +500,21 @@ class AboutDialog(QWidget):
         self.content_animation.setEasingCurve(QEasingCurve.OutQuint)
         self.animation.addAnimation(self.content_animation)
 
+        # One-shot, armed only while the dialog is visible and re-armed after each levitation
         self.frog_timer = QTimer(self)
+        self.frog_timer.setSingleShot(True)
+        self.frog_timer.setInterval(12000)
         self.frog_timer.timeout.connect(self.levitate_frog)
-        self.frog_timer.start(12000)
-
-        # Load SVG frog
-        self.frog_svg = QSvgRenderer(absolute_path("assets/tf.svg"))
-        self.frog_pixmap = QPixmap(30, 30)
-        self.frog_pixmap.fill(Qt.transparent)
-        painter = QPainter(self.frog_pixmap)
-        self.frog_svg.render(painter)
-        painter.end()
 
-        self.frog_label = QLabel(self)
-        self.frog_label.setFixedSize(30, 30)
+        # The frog is only built the first time it levitates
+        self.frog_label = None
+
+    def build_frog(self):
+        # Load SVG frog, parsed once and shared by every dialog
+        if AboutDialog._frog_svg is None:
+            AboutDialog._frog_svg = QSvgRenderer(absolute_path("assets/tf.svg"))
+
+        self.frog_label = FrogWidget(self._frog_svg, self)
         self.frog_label.hide()
 
         # Frog rotation animation
@@ -400,48 +525,37 @@ class AboutDialog(QWidget):
         self.rotation_anim.setLoopCount(-1)  # Infinite loop
         self.rotation_anim.valueChanged.connect(self.rotateFrog)
 
-    def levitate_frog(self):
-        if random.random() < 1.0:
-            start_x = -30
-            end_x = self.width() + 30
-            y = random.randint(50, self.height() - 50)
-
-            self.frog_label.move(start_x, y)
-            self.frog_label.show()
-
-            self.frog_anim = QPropertyAnimation(self.frog_label, b"pos")
-            self.frog_anim.setDuration(5000)
-            self.frog_anim.setStartValue(QPoint(start_x, y))
-            self.frog_anim.setEndValue(QPoint(end_x, y))
-            self.frog_anim.setEasingCurve(QEasingCurve.InOutSine)
-            self.frog_anim.finished.connect(self.frog_label.hide)
-            self.frog_anim.finished.connect(self.rotation_anim.stop)
-            self.frog_anim.start()
+        # Frog flight animation, endpoints are set per levitation
+        self.frog_anim = QPropertyAnimation(self.frog_label, b"pos")
+        self.frog_anim.setDuration(5000)
+        self.frog_anim.setEasingCurve(QEasingCurve.InOutSine)
+        self.frog_anim.finished.connect(self.frog_landed)
 
-            self.rotation_anim.start()
+    def levitate_frog(self):
+        if self.frog_label is None:
+            self.build_frog()
 
-    def rotateFrog(self, angle):
-        # Create a rotated and scaled version of the frog
-        transform = QTransform()
+        start_x = -30
+        end_x = self.width() + 30
+        y = random.randint(50, self.height() - 50)
 
-        # Rotate
-        transform.rotate(angle)
+        self.frog_label.move(start_x, y)
+        self.frog_label.show()
 
-        # Scale based on rotation to create 3D illusion
-        scale = 0.5 + abs(math.sin(math.radians(angle))) * 0.5
-        transform.scale(scale, 1.0)
+        self.frog_anim.setStartValue(QPoint(start_x, y))
+        self.frog_anim.setEndValue(QPoint(end_x, y))
+        self.frog_anim.start()
 
-        rotated_pixmap = self.frog_pixmap.transformed(transform, Qt.SmoothTransformation)
+        self.rotation_anim.start()
 
-        # Ensure the rotated pixmap is centered
-        centered_pixmap = QPixmap(30, 30)
-        centered_pixmap.fill(Qt.transparent)
-        painter = QPainter(centered_pixmap)
-        painter.drawPixmap(QPointF((30 - rotated_pixmap.width()) / 2, (30 - rotated_pixmap.height()) / 2),
-                           rotated_pixmap)
-        painter.end()
+    def frog_landed(self):
+        self.frog_label.hide()
+        self.rotation_anim.stop()
+        if self.isVisible():
+            self.frog_timer.start()
 
-        self.frog_label.setPixmap(centered_pixmap)
+    def rotateFrog(self, angle):
+        self.frog_label.set_angle(angle)
 
     def showEvent(self, event):
         super().showEvent(event)
@@ -454,6 +568,11 @@ class AboutDialog(QWidget):
         self.content_animation.setEndValue(end_rect)
 
         self.animation.start()
+        self.frog_timer.start()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.frog_timer.stop()
 
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -478,6 +597,7 @@ class Minimap(QWidget):
         self.view_rect = QRectF()
         self.full_rect = QRectF()
         self.pixmap = None
+        self._cached_bg = None
         self.dragging = False
         self.drag_start = QPointF()
         self.view_rect_start = QRectF()
@@ -498,20 +618,16 @@ class Minimap(QWidget):
             new_view_rect = self.view_rect_start.translated(delta)
 
             # Constrain the view rectangle within the minimap
-            if new_view_rect.left() < 0:
-                new_view_rect.moveLeft(0)
-            if new_view_rect.right() > self.width():
-                new_view_rect.moveRight(self.width())
-            if new_view_rect.top() < 0:
-                new_view_rect.moveTop(0)
-            if new_view_rect.bottom() > self.height():
-                new_view_rect.moveBottom(self.height())
+            x = max(0, min(new_view_rect.x(), self.width() - new_view_rect.width()))
+            y = max(0, min(new_view_rect.y(), self.height() - new_view_rect.height()))
+            new_view_rect.moveTopLeft(QPointF(x, y))
 
             self.move_view(new_view_rect.center())
 
     def mouseReleaseEvent(self, event):
         if event.button() == Qt.LeftButton:
             self.dragging = False
+            self.update()
 
     def move_view(self, pos):
         if self.full_rect.isNull():
@@ -523,9 +639,34 @@ class Minimap(QWidget):
         self.parent().center_on(new_center)
 
     def set_pixmap(self, pixmap):
-        self.pixmap = pixmap.scaled(self.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        # Scaling is deferred to the first paint, a hidden minimap never pays for it
+        self.pixmap = pixmap
+        self._cached_bg = None
         self.update()
 
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._cached_bg = None
+
+    def build_background(self):
+        # Image, overlay and outline only change with the image, size or screen, render them once
+        # at the device pixel ratio so the outline and image stay sharp on HiDPI displays
+        ratio = self.devicePixelRatioF()
+        self._cached_bg = QPixmap(self.size() * ratio)
+        self._cached_bg.setDevicePixelRatio(ratio)
+        self._cached_bg.fill(Qt.transparent)
+
+        scaled = self.pixmap.scaled(self.size() * ratio, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        scaled.setDevicePixelRatio(ratio)
+
+        painter = QPainter(self._cached_bg)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.drawPixmap(self.rect(), scaled)
+        painter.fillRect(self.rect(), QColor(52, 73, 94, 100))
+        painter.setPen(QPen(Qt.white, 1))
+        painter.drawRect(self.rect().adjusted(1, 1, -1, -1))
+        painter.end()
+
     def map_rect_to_minimap(self, rect, full_rect):
         if full_rect.width() == 0 or full_rect.height() == 0:
             return QRectF()  # Return an empty QRectF if the full_rect has zero width or height
@@ -551,18 +692,14 @@ class Minimap(QWidget):
         if self.pixmap is None:
             return
 
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-
-        # Draw background image
-        painter.drawPixmap(self.rect(), self.pixmap)
+        if self._cached_bg is None or self._cached_bg.devicePixelRatioF() != self.devicePixelRatioF():
+            self.build_background()
 
-        # Draw semi-transparent overlay
-        painter.fillRect(self.rect(), QColor(52, 73, 94, 100))
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing, not self.dragging)
 
-        # Draw full image area outline
-        painter.setPen(QPen(Qt.white, 1))
-        painter.drawRect(self.rect().adjusted(1, 1, -1, -1))
+        # Draw cached background image, overlay and outline
+        painter.drawPixmap(0, 0, self._cached_bg)
 
         # Draw view area
         if not self.full_rect.isNull():
@@ -582,7 +719,7 @@ class CustomGraphicsView(QGraphicsView):
         self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.setDragMode(QGraphicsView.NoDrag)
-        self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+        self.setViewportUpdateMode(QGraphicsView.BoundingRectViewportUpdate)
         self.setOptimizationFlags(QGraphicsView.DontAdjustForAntialiasing)
         self.cursorCustom = cursorCustom
 
@@ -601,6 +738,11 @@ class CustomGraphicsView(QGraphicsView):
         self.zoom_threshold = 10
         self.panning_enabled = True
 
+        # Coalesces minimap refreshes from pan/zoom/inertia to at most one per frame
+        self.minimap_timer = QTimer(self)
+        self.minimap_timer.setSingleShot(True)
+        self.minimap_timer.timeout.connect(self.update_minimap)
+
 
     def setPanningEnabled(self, enabled):
         self.panning_enabled = enabled
@@ -630,7 +772,7 @@ class CustomGraphicsView(QGraphicsView):
         if event.phase() == Qt.ScrollEnd:
             self.zoom_accumulator = 0
 
-        self.update_minimap()
+        self.schedule_minimap_update()
         event.accept()
 
     def mousePressEvent(self, event):
@@ -639,6 +781,8 @@ class CustomGraphicsView(QGraphicsView):
             self.last_pan_pos = event.pos()
             self.pan_inertia = QPointF(0, 0)
             self.inertia_timer.stop()
+            # Nearest-neighbour blits while panning, smooth resampling returns once the view settles
+            self.setRenderHint(QPainter.SmoothPixmapTransform, False)
         super().mousePressEvent(event)
 
     def mouseMoveEvent(self, event):
@@ -648,7 +792,7 @@ class CustomGraphicsView(QGraphicsView):
             self.horizontalScrollBar().setValue(self.horizontalScrollBar().value() - delta.x())
             self.verticalScrollBar().setValue(self.verticalScrollBar().value() - delta.y())
             self.last_pan_pos = event.pos()
-            self.update_minimap()
+            self.schedule_minimap_update()
         super().mouseMoveEvent(event)
 
     def mouseReleaseEvent(self, event):
@@ -671,12 +815,15 @@ class CustomGraphicsView(QGraphicsView):
     def apply_inertia(self):
         if self.pan_inertia.manhattanLength() < 0.1:
             self.inertia_timer.stop()
+            if not self.renderHints() & QPainter.SmoothPixmapTransform:
+                self.setRenderHint(QPainter.SmoothPixmapTransform, True)
+                self.viewport().update()
             return
 
         self.horizontalScrollBar().setValue(self.horizontalScrollBar().value() - int(self.pan_inertia.x()))
         self.verticalScrollBar().setValue(self.verticalScrollBar().value() - int(self.pan_inertia.y()))
         self.pan_inertia *= 0.95
-        self.update_minimap()
+        self.schedule_minimap_update()
 
     def zoom_slider_changed(self, value):
         current_zoom = self.transform().m11() * 100
@@ -691,6 +838,10 @@ class CustomGraphicsView(QGraphicsView):
     def set_image(self, pixmap):
         self.minimap.set_pixmap(pixmap)
 
+    def schedule_minimap_update(self):
+        if not self.minimap_timer.isActive():
+            self.minimap_timer.start(16)
+
     def update_minimap(self):
         if self.scene() and not self.scene().sceneRect().isEmpty():
             view_rect = self.mapToScene(self.viewport().rect()).boundingRect()
@@ -700,6 +851,22 @@ class CustomGraphicsView(QGraphicsView):
             self.minimap.hide()
 
 class ToastNotification(QWidget):
+    TITLE_STYLE = "color: white; font-size: 16px; font-weight: bold;"
+    MESSAGE_STYLE = "color: white; font-size: 14px;"
+    BUTTON_STYLE = """
+        QPushButton {
+            background-color: #34495e;
+            color: white;
+            border: none;
+            border-radius: 5px;
+            padding: 5px 15px;
+            margin: 5px;
+        }
+        QPushButton:hover {
+            background-color: #3498db;
+        }
+    """
+
     def __init__(self, parent, title, message, buttons=None, timeout=5000):
         super().__init__(parent)
         self.parent = parent
@@ -718,12 +885,12 @@ class ToastNotification(QWidget):
 
         # Title
         self.title_label = QLabel(title)
-        self.title_label.setStyleSheet("color: white; font-size: 16px; font-weight: bold;")
+        self.title_label.setStyleSheet(self.TITLE_STYLE)
         layout.addWidget(self.title_label)
 
         # Message
         self.message_label = QLabel(message)
-        self.message_label.setStyleSheet("color: white; font-size: 14px;")
+        self.message_label.setStyleSheet(self.MESSAGE_STYLE)
         self.message_label.setWordWrap(True)
         layout.addWidget(self.message_label)
 
@@ -733,19 +900,7 @@ class ToastNotification(QWidget):
             button_layout = QHBoxLayout()
             for button_text in buttons:
                 button = QPushButton(button_text)
-                button.setStyleSheet("""
-                    QPushButton {
-                        background-color: #34495e;
-                        color: white;
-                        border: none;
-                        border-radius: 5px;
-                        padding: 5px 15px;
-                        margin: 5px;
-                    }
-                    QPushButton:hover {
-                        background-color: #3498db;
-                    }
-                """)
+                button.setStyleSheet(self.BUTTON_STYLE)
                 button_layout.addWidget(button)
                 self.buttons[button_text] = button
             layout.addLayout(button_layout)
@@ -756,16 +911,14 @@ class ToastNotification(QWidget):
         self.move(parent.width() - self.width() - 20, parent.height() - self.height() - 20)
 
         # Fade in animation
-        self.opacity_effect = QGraphicsOpacityEffect(self)
-        self.setGraphicsEffect(self.opacity_effect)
-        self.fade_in_animation = QPropertyAnimation(self.opacity_effect, b"opacity")
+        self.fade_in_animation = QPropertyAnimation(self, b"windowOpacity")
         self.fade_in_animation.setDuration(500)
         self.fade_in_animation.setStartValue(0)
         self.fade_in_animation.setEndValue(1)
         self.fade_in_animation.setEasingCurve(QEasingCurve.InOutQuad)
 
         # Fade out animation
-        self.fade_out_animation = QPropertyAnimation(self.opacity_effect, b"opacity")
+        self.fade_out_animation = QPropertyAnimation(self, b"windowOpacity")
         self.fade_out_animation.setDuration(500)
         self.fade_out_animation.setStartValue(1)
         self.fade_out_animation.setEndValue(0)
@@ -812,6 +965,24 @@ class ToastNotification(QWidget):
 
 
 class TourGuide(QWidget):
+    MESSAGE_STYLE = """
+        background-color: rgba(52, 73, 94, 220);
+        color: white;
+        border-radius: 10px;
+        padding: 10px;
+    """
+    BUTTON_STYLE = """
+        background-color: #3498db;
+        color: white;
+        border: none;
+        padding: 5px 10px;
+        border-radius: 5px;
+    """
+    ARROW_STYLE = """
+        color: rgba(52, 73, 94, 220);
+        font-size: 16px;
+    """
+
     def __init__(self, parent):
         super().__init__(parent)
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.Tool)
@@ -821,22 +992,11 @@ class TourGuide(QWidget):
         self.layout = QVBoxLayout(self)
         self.message = QLabel()
         self.message.setWordWrap(True)
-        self.message.setStyleSheet("""
-            background-color: rgba(52, 73, 94, 220);
-            color: white;
-            border-radius: 10px;
-            padding: 10px;
-        """)
+        self.message.setStyleSheet(self.MESSAGE_STYLE)
         self.layout.addWidget(self.message)
 
         self.next_button = QPushButton("Next")
-        self.next_button.setStyleSheet("""
-            background-color: #3498db;
-            color: white;
-            border: none;
-            padding: 5px 10px;
-            border-radius: 5px;
-        """)
+        self.next_button.setStyleSheet(self.BUTTON_STYLE)
         self.layout.addWidget(self.next_button)
 
         self.setFixedWidth(420)  # Set a fixed width to make it narrower
@@ -845,10 +1005,7 @@ class TourGuide(QWidget):
         self.setGraphicsEffect(self.opacity_effect)
 
         self.arrow = QLabel("▲")  # Unicode up arrow
-        self.arrow.setStyleSheet("""
-                    color: rgba(52, 73, 94, 220);
-                    font-size: 16px;
-                """)
+        self.arrow.setStyleSheet(self.ARROW_STYLE)
         self.layout.insertWidget(0, self.arrow, 0, Qt.AlignCenter)
 
         self.opacity_animation = QPropertyAnimation(self.opacity_effect, b"opacity")
@@ -884,22 +1041,11 @@ class TourGuide(QWidget):
         return self.parent().rect().center() - self.rect().center()
 
     def adjust_position(self, pos):
+        # Clamp the guide inside the parent, the left/top edge wins when it does not fit
         parent_rect = self.parent().rect()
-        guide_rect = self.rect()
-
-        # Adjust x-coordinate
-        if pos.x() + guide_rect.width() > parent_rect.width():
-            pos.setX(parent_rect.width() - guide_rect.width())
-        if pos.x() < 0:
-            pos.setX(0)
-
-        # Adjust y-coordinate
-        if pos.y() + guide_rect.height() > parent_rect.height():
-            pos.setY(parent_rect.height() - guide_rect.height())
-        if pos.y() < 0:
-            pos.setY(0)
-
-        return pos
+        x = max(0, min(pos.x(), parent_rect.width() - self.width()))
+        y = max(0, min(pos.y(), parent_rect.height() - self.height()))
+        return QPoint(x, y)
 
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -915,15 +1061,26 @@ class CustomGraphicsScene(QGraphicsScene):
         super().__init__(parent)
         self.parent = parent
 
+        # Labels moved since the last frame, their lines are refreshed together
+        self._dirty_labels = set()
+        self.line_update_timer = QTimer(self)
+        self.line_update_timer.setSingleShot(True)
+        self.line_update_timer.setInterval(16)
+        self.line_update_timer.timeout.connect(self.update_connection_lines)
+
+    def schedule_line_update(self, label):
+        self._dirty_labels.add(label)
+        if not self.line_update_timer.isActive():
+            self.line_update_timer.start()
+
     def update_connection_lines(self):
-        for particle in self.particles:
-            if 'label_item' in particle and 'line_item' in particle:
-                label = particle['label_item']
-                line = particle['line_item']
+        for label in self._dirty_labels:
+            particle = label.particle_ref
+            if particle is not None and 'line_item' in particle:
                 start = QPointF(particle['x'], particle['y'])
                 end = label.sceneBoundingRect().center()
-                line.setLine(QLineF(start, end))
-                self.set_unsaved_changes()
+                particle['line_item'].setLine(QLineF(start, end))
+        self._dirty_labels.clear()
 
 
 class DraggableLabelSignals(QObject):
@@ -943,10 +1100,26 @@ class ScrollWheel(QWidget):
         self.last_y = None
         self.sensitivity = 0.01 if is_fine else 0.1
         self.is_fine = is_fine
+        self._picture = None
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._picture = None
 
     def paintEvent(self, event):
+        # The wheel does not depend on its value, record the drawing once and replay it
+        if self._picture is None:
+            self._picture = QPicture()
+            picture_painter = QPainter(self._picture)
+            self.draw_wheel(picture_painter)
+            picture_painter.end()
+
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
+        painter.drawPicture(0, 0, self._picture)
+
+    def draw_wheel(self, painter):
+        painter.setRenderHint(QPainter.Antialiasing)
 
         # Draw background
         painter.fillRect(self.rect(), QColor(50, 50, 50))
@@ -1007,7 +1180,7 @@ class ModernButton(QPushButton):
     def __init__(self, icon_path, text, parent=None):
         super().__init__(parent)
         self.setText(text)
-        self.setIcon(QIcon(absolute_path(icon_path)))
+        self.setIcon(cached_icon(icon_path))
         self.setIconSize(QSize(32, 32))
         self.setCursor(Qt.PointingHandCursor)
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
@@ -1046,7 +1219,14 @@ class DraggableLabel(QGraphicsItemGroup):
         self.height = height
         self.analyzer = analyzer
         self.signals = DraggableLabelSignals()
+        self.background_item = None
+        self.text_item = None
         self.delete_button = None
+        self.delete_cross = None
+        self.cross_size = None
+        self.label_text = None
+        self.particle_ref = None
+        self.moved_since_press = False
         self.notes = ""
         self.create_label()
 
@@ -1081,16 +1261,25 @@ class DraggableLabel(QGraphicsItemGroup):
         delete_cross.setFont(QFont("Arial", delete_button_size - 4, QFont.Bold))
         delete_cross.setDefaultTextColor(QColor(255, 255, 255))
 
-        cross_rect = delete_cross.boundingRect()
-        cross_x = delete_button.rect().x() + (delete_button_size - cross_rect.width()) / 2
-        cross_y = delete_button.rect().y() + (delete_button_size - cross_rect.height()) / 2
+        # The glyph and its font never change, measure it once for centering
+        self.cross_size = delete_cross.boundingRect().size()
+        cross_x = delete_button.rect().x() + (delete_button_size - self.cross_size.width()) / 2
+        cross_y = delete_button.rect().y() + (delete_button_size - self.cross_size.height()) / 2
         delete_cross.setPos(cross_x, cross_y)
 
+        # Keep the laid-out text rasterized between repaints, setPlainText invalidates the cache
+        label.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        delete_cross.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+
         self.addToGroup(background)
         self.addToGroup(label)
         self.addToGroup(delete_button)
         self.addToGroup(delete_cross)
+        self.background_item = background
+        self.text_item = label
         self.delete_button = delete_button
+        self.delete_cross = delete_cross
+        self.label_text = label_text
 
         # Apply a fixed scale to ensure consistent size across different resolutions
         scale_factor = 1 / self.analyzer.scale_factor
@@ -1099,6 +1288,8 @@ class DraggableLabel(QGraphicsItemGroup):
         self.setPos(self.x + 10 / scale_factor, self.y - total_height * scale_factor - 10 / scale_factor)
 
     def mousePressEvent(self, event):
+        # Programmatic setPos calls also set the flag, only moves after this press count as a drag
+        self.moved_since_press = False
         if event.button() == Qt.RightButton:
             self.show_context_menu(event.screenPos())
         elif self.delete_button.contains(event.pos()):
@@ -1110,8 +1301,7 @@ class DraggableLabel(QGraphicsItemGroup):
         menu = QMenu()
         rename_action = menu.addAction("Rename")
         names_submenu = menu.addMenu("Select Name")
-        for name in self.analyzer.used_names:
-            names_submenu.addAction(name)
+        names_submenu.addActions(self.analyzer._name_actions)
 
         notes_action = menu.addAction("Notes...") if AUTO_UPDATE_ENABLED else None
 
@@ -1123,8 +1313,8 @@ class DraggableLabel(QGraphicsItemGroup):
             self.rename()
         elif action == delete_action:
             self.signals.deleteRequested.emit(self)
-        elif action and action.text() in self.analyzer.used_names:
-            self.name = action.text()
+        elif action and action.data() is not None:
+            self.name = action.data()
             self.update_label_text()
             self.analyzer.update_particle_data(self, {'name': self.name})
         elif action == notes_action:
@@ -1163,42 +1353,56 @@ class DraggableLabel(QGraphicsItemGroup):
 
     def update_label_text(self):
         label_text = self.get_label_text()
-        text_item = self.childItems()[1]
-        text_item.setPlainText(label_text)
+        if label_text == self.label_text:
+            return
+        self.label_text = label_text
+        self.text_item.setPlainText(label_text)
 
         # Recalculate size
-        text_width = text_item.boundingRect().width()
-        text_height = text_item.boundingRect().height()
+        text_rect = self.text_item.boundingRect()
+        text_width = text_rect.width()
+        text_height = text_rect.height()
         padding = 8
         delete_button_size = 20
         total_width = max(text_width + delete_button_size + padding * 2, 100)  # Minimum width of 100
         total_height = max(text_height, delete_button_size) + padding * 2
 
         # Update background rectangle
-        background = self.childItems()[0]
-        background.setRect(0, 0, total_width, total_height)
+        self.background_item.setRect(0, 0, total_width, total_height)
 
         # Update delete button position
-        delete_button = self.childItems()[2]
-        delete_button.setRect(total_width - delete_button_size - padding, padding, delete_button_size,
-                              delete_button_size)
+        self.delete_button.setRect(total_width - delete_button_size - padding, padding, delete_button_size,
+                                   delete_button_size)
 
         # Update delete cross position
-        delete_cross = self.childItems()[3]
-        cross_rect = delete_cross.boundingRect()
-        cross_x = delete_button.rect().x() + (delete_button_size - cross_rect.width()) / 2
-        cross_y = delete_button.rect().y() + (delete_button_size - cross_rect.height()) / 2
-        delete_cross.setPos(cross_x, cross_y)
+        cross_x = self.delete_button.rect().x() + (delete_button_size - self.cross_size.width()) / 2
+        cross_y = self.delete_button.rect().y() + (delete_button_size - self.cross_size.height()) / 2
+        self.delete_cross.setPos(cross_x, cross_y)
         self.analyzer.set_unsaved_changes()
 
+    def mouseReleaseEvent(self, event):
+        super().mouseReleaseEvent(event)
+        # A drag is one edit, mark the workspace once when it ends rather than on every move
+        if self.moved_since_press:
+            self.moved_since_press = False
+            self.analyzer.set_unsaved_changes()
+
     def itemChange(self, change, value):
         if change == QGraphicsItemGroup.ItemPositionHasChanged:
             self.signals.moved.emit(self)
-            self.analyzer.set_unsaved_changes()
+            self.moved_since_press = True
         return super().itemChange(change, value)
 
 
 class CapillaryAnalyzer(QMainWindow):
+    # Number, optional whitespace, then a unit made of letters
+    UNIT_PATTERN = re.compile(r'^(\d+\.?\d*|\.\d+)\s*([^\d.\s]*)$')
+    # Conversion factors to micrometers, a bare number is taken as micrometers
+    UNIT_FACTORS = {'': 1, 'um': 1, 'μm': 1, 'µm': 1, 'mm': 1000, 'pm': 1 / 1000}
+    # Finished cursors keyed by (svg_path, rgba), shared across windows
+    _cursor_cache = {}
+    _cursor_cross = None
+
     def __init__(self):
         self.cursorCustom = cursorCustom
         super().__init__()
@@ -1241,6 +1445,7 @@ class CapillaryAnalyzer(QMainWindow):
         self.floor_ghost_line = None
 
         self.has_completed_tour = False
+        self.update_check_thread = None
 
         self.tour_guide = TourGuide(self)
         self.tour_guide.next_button.clicked.connect(self.next_tour_step)
@@ -1290,8 +1495,7 @@ class CapillaryAnalyzer(QMainWindow):
 
         # Logo space
         logo_label = QLabel()
-        logo_pixmap = QPixmap(absolute_path("assets/phase_logo_v3.svg"))
-        logo_label.setPixmap(logo_pixmap.scaled(120, 60, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        logo_label.setPixmap(scaled_pixmap("assets/phase_logo_v3.svg", 120, 60))
         logo_label.setAlignment(Qt.AlignCenter)
         control_layout.addWidget(logo_label)
 
@@ -1492,11 +1696,11 @@ class CapillaryAnalyzer(QMainWindow):
         # Reset and Clear buttons
         reset_clear_layout = QHBoxLayout()
 
-        self.reset_angle_button = self.create_small_button("Reset Angle", absolute_path("assets/reset_icon.svg"))
+        self.reset_angle_button = self.create_small_button("Reset Angle", "assets/reset_icon.svg")
         self.reset_angle_button.clicked.connect(self.reset_angle)
         reset_clear_layout.addWidget(self.reset_angle_button)
 
-        self.clear_selections_button = self.create_small_button("Clear All", absolute_path("assets/clear_icon.svg"))
+        self.clear_selections_button = self.create_small_button("Clear All", "assets/clear_icon.svg")
         self.clear_selections_button.clicked.connect(self.clear_selections)
         reset_clear_layout.addWidget(self.clear_selections_button)
 
@@ -1554,11 +1758,18 @@ class CapillaryAnalyzer(QMainWindow):
         self.image_item = None
         self.capillary_height = None
         self.particles = []
+        self._label_to_particle = {}
         self.particle_items = []
         self.ceiling_y = None
         self.floor_y = None
+        self._scale_key = None
+        self._um_per_px = None
+        self._wall_adjustment = 0
+        self._slope_text = None
+        self._slope = 0.0
         self.current_mode = None
         self.used_names = set()
+        self._name_actions = []
 
         self.ceiling_line = None
         self.floor_line = None
@@ -1700,32 +1911,19 @@ class CapillaryAnalyzer(QMainWindow):
         if not input_text:
             return None
 
-        try:
-            # Find where the number ends and the unit begins
-            for i, char in enumerate(input_text):
-                if not (char.isdigit() or char == '.'):
-                    number = float(input_text[:i])
-                    unit = input_text[i:]
-                    break
-            else:
-                number = float(input_text)
-                unit = 'um'  # Default to micrometers if no unit is specified
-
-            # Convert to micrometers
-            if unit in ['um', 'μm']:
-                return number
-            elif unit == 'mm':
-                return number * 1000
-            elif unit == 'pm':
-                return number / 1000
-            else:
-                self.show_toast("Invalid Unit. Please use um, mm, or pm.", message_type="error")
-                return None
-        except ValueError:
+        match = self.UNIT_PATTERN.match(input_text)
+        if match is None:
             self.show_toast("Invalid Input. Please enter a valid number followed by a unit (um, mm, or pm).",
                             message_type="error")
             return None
 
+        number, unit = match.groups()
+        factor = self.UNIT_FACTORS.get(unit)
+        if factor is None:
+            self.show_toast("Invalid Unit. Please use um, mm, or pm.", message_type="error")
+            return None
+        return float(number) * factor
+
     def create_menu_bar(self):
         menu_bar = self.menuBar()
 
@@ -1820,7 +2018,7 @@ class CapillaryAnalyzer(QMainWindow):
             url = "https://raw.githubusercontent.com/vxco/PHASe/refs/heads/master/height_reference.json"
             response = requests.get(url)
             response.raise_for_status()
-            reference_data = json.loads(response.text)
+            reference_data = response.json()
 
             dialog = QDialog(self)
             dialog.setWindowTitle("Height Reference")
@@ -1967,6 +2165,8 @@ class CapillaryAnalyzer(QMainWindow):
         self.update_recent_files_menu()
 
     def set_unsaved_changes(self, value=True):
+        if self.unsaved_changes == value:
+            return
         self.unsaved_changes = value
         self.update_window_title()
 
@@ -2042,6 +2242,9 @@ class CapillaryAnalyzer(QMainWindow):
         else:
             event.accept()
 
+        if event.isAccepted():
+            self.wait_for_update_check()
+
     def clear_workspace(self):
         self.show_info_message(
             "Clear Workspace",
@@ -2064,7 +2267,8 @@ class CapillaryAnalyzer(QMainWindow):
             self.angle_value = 0
             self.wall_thickness = 0
             self.particles = []
-            self.used_names.clear()
+            self._label_to_particle = {}
+            self.set_used_names([])
 
             # Reset UI elements
             self.height_input.clear()
@@ -2297,7 +2501,7 @@ class CapillaryAnalyzer(QMainWindow):
                 self.floor_y = workspace_data.get('floor_y')
                 self.angle_value = workspace_data.get('angle_value', 0)
                 self.wall_thickness = workspace_data.get('wall_thickness', 0)
-                self.used_names = set(workspace_data.get('used_names', []))
+                self.set_used_names(workspace_data.get('used_names', []))
 
                 if 'image' in workspace_data:
                     image_data = base64.b64decode(workspace_data['image'])
@@ -2395,15 +2599,14 @@ class CapillaryAnalyzer(QMainWindow):
         QTimer.singleShot(timeout, self.toast_label.hide)
 
     def create_custom_cursor(self, svg_path, color):
-        # Create a base pixmap for the cursor
-        base_pixmap = QPixmap(32, 32)
-        base_pixmap.fill(Qt.transparent)
+        key = (svg_path, color.rgba())
+        cursor = self._cursor_cache.get(key)
+        if cursor is not None:
+            return cursor
 
-        # Draw the cross
+        # Start from a copy of the shared cross, painting below detaches it
+        base_pixmap = QPixmap(self.cursor_cross())
         painter = QPainter(base_pixmap)
-        painter.setPen(QPen(Qt.white, 2))
-        painter.drawLine(16, 0, 16, 32)  # Vertical line
-        painter.drawLine(0, 16, 32, 16)  # Horizontal line
 
         # Load and color the SVG icon
         icon = QIcon(absolute_path(svg_path))
@@ -2418,7 +2621,23 @@ class CapillaryAnalyzer(QMainWindow):
 
         painter.end()
 
-        return QCursor(base_pixmap, 16, 16)  # Hotspot at the center of the cross
+        cursor = QCursor(base_pixmap, 16, 16)  # Hotspot at the center of the cross
+        self._cursor_cache[key] = cursor
+        return cursor
+
+    @classmethod
+    def cursor_cross(cls):
+        # Built on first use, a QPixmap cannot exist before the QApplication
+        if cls._cursor_cross is None:
+            cls._cursor_cross = QPixmap(32, 32)
+            cls._cursor_cross.fill(Qt.transparent)
+
+            painter = QPainter(cls._cursor_cross)
+            painter.setPen(QPen(Qt.white, 2))
+            painter.drawLine(16, 0, 16, 32)  # Vertical line
+            painter.drawLine(0, 16, 32, 16)  # Horizontal line
+            painter.end()
+        return cls._cursor_cross
 
     def hide_toast(self):
         if hasattr(self, 'toast_label'):
@@ -2598,6 +2817,7 @@ class CapillaryAnalyzer(QMainWindow):
             self.scene.removeItem(particle['dot_item'])
             self.scene.removeItem(particle['line_item'])
         self.particles.clear()
+        self._label_to_particle = {}
         self.scene.update()
         self.update_lines()
         self.set_unsaved_changes()
@@ -2722,6 +2942,7 @@ class CapillaryAnalyzer(QMainWindow):
                 self.scale_factor = self.original_image.width() / base_width
 
                 self.particles = []
+                self._label_to_particle = {}
                 self.ceiling_y = None
                 self.floor_y = None
                 self.initial_setup_complete = False
@@ -3011,7 +3232,7 @@ class CapillaryAnalyzer(QMainWindow):
     def create_small_button(self, text, icon_path=None):
         button = QPushButton(text)
         if icon_path:
-            button.setIcon(QIcon(icon_path))
+            button.setIcon(cached_icon(icon_path))
         button.setStyleSheet("""
             QPushButton {
                 background-color: #34495e;
@@ -3031,29 +3252,53 @@ class CapillaryAnalyzer(QMainWindow):
         """)
         return button
 
-    def calculate_height(self, x, y):
-        if self.capillary_height is not None and self.ceiling_y is not None and self.floor_y is not None:
+    def _recompute_scale(self):
+        # The scale only depends on these values, so it is reused until one of them changes
+        key = (self.capillary_height, self.ceiling_y, self.floor_y, self.wall_thickness)
+        if key == self._scale_key:
+            return self._um_per_px is not None
+
+        self._scale_key = key
+        self._um_per_px = None
+        self._wall_adjustment = 0
+        if not self.capillary_height or self.ceiling_y is None or self.floor_y is None:
+            return False
+
+        # The angle shifts ceiling and floor by the same amount, so their distance is constant along x
+        total_pixels = self.ceiling_y - self.floor_y
+        if self.wall_thickness > 0:
+            self._wall_adjustment = (self.wall_thickness / self.capillary_height) * abs(total_pixels)
+
+        adjusted_total_pixels = abs(total_pixels + 2 * self._wall_adjustment)
+        if adjusted_total_pixels == 0:
+            return False
+        self._um_per_px = self.capillary_height / adjusted_total_pixels
+        return True
+
+    def current_slope(self):
+        # Parsed and converted only when the angle text changes
+        text = self.angle_input.text()
+        if text != self._slope_text:
             try:
-                angle = float(self.angle_input.text())
+                angle = float(text)
             except ValueError:
                 angle = 0  # Default to 0 if the input is empty or invalid
+            self._slope_text = text
+            self._slope = math.tan(math.radians(angle))
+        return self._slope
 
-            slope = math.tan(math.radians(angle))
-
-            ceiling_y = self.ceiling_y + x * slope
-            floor_y = self.floor_y + x * slope
-
-            total_pixels = abs(ceiling_y - floor_y)
+    def calculate_height(self, x, y):
+        return self.calculate_heights([(x, y)])[0]
 
-            if self.wall_thickness > 0:
-                wall_adjustment = (self.wall_thickness / self.capillary_height) * total_pixels
-                ceiling_y += wall_adjustment
-                floor_y -= wall_adjustment
+    def calculate_heights(self, points):
+        # Scale, slope and wall offset are shared by every point, resolve them once per batch
+        if not self._recompute_scale():
+            return [0] * len(points)
 
-            adjusted_total_pixels = abs(ceiling_y - floor_y)
-            pixels_from_bottom = abs(y - floor_y)
-            return (pixels_from_bottom / adjusted_total_pixels) * self.capillary_height
-        return 0
+        slope = self.current_slope()
+        floor_y = self.floor_y - self._wall_adjustment
+        um_per_px = self._um_per_px
+        return [abs(y - (floor_y + x * slope)) * um_per_px for x, y in points]
 
     def update_particles(self):
         if self.capillary_height is not None:
@@ -3080,11 +3325,13 @@ class CapillaryAnalyzer(QMainWindow):
                 if 'line_item' in particle:
                     self.scene.removeItem(particle['line_item'])
 
-            for particle in self.particles:
-                x, y = particle['x'], particle['y']
+            # Recalculate heights based on new angle
+            heights = self.calculate_heights([(particle['x'], particle['y']) for particle in self.particles])
 
-                # Recalculate height based on new angle
-                particle['height'] = self.calculate_height(x, y)
+            self._label_to_particle = {}
+            for particle, height in zip(self.particles, heights):
+                x, y = particle['x'], particle['y']
+                particle['height'] = height
 
                 # Scale the particle dot size
                 dot_size = 6 * self.scale_factor
@@ -3104,7 +3351,7 @@ class CapillaryAnalyzer(QMainWindow):
                     label.setPos(QPointF(x + 10, y - 60))
 
                 label.signals.deleteRequested.connect(self.delete_particle)
-                label.signals.moved.connect(self.update_connection_lines)
+                label.signals.moved.connect(self.scene.schedule_line_update)
                 self.scene.addItem(label)
 
                 # Scale the line width
@@ -3115,6 +3362,8 @@ class CapillaryAnalyzer(QMainWindow):
                 particle['label_item'] = label
                 particle['dot_item'] = particle_dot
                 particle['line_item'] = line
+                label.particle_ref = particle
+                self._label_to_particle[label] = particle
 
             self.update_connection_lines()
             self.scene.update()
@@ -3150,19 +3399,16 @@ class CapillaryAnalyzer(QMainWindow):
             callback(response)
 
     def update_particle_data(self, label, new_data):
-        for particle in self.particles:
-            if 'label_item' in particle and particle['label_item'] == label:
-                particle.update(new_data)
-                if 'name' in new_data:
-                    self.add_used_name(new_data['name'])
-                break
-            elif 'x' in particle and 'y' in particle:
-                # If label_item is not present, compare positions
-                if abs(particle['x'] - label.x) < 1 and abs(particle['y'] - label.y) < 1:
-                    particle.update(new_data)
-                    if 'name' in new_data:
-                        self.add_used_name(new_data['name'])
-                    break
+        particle = self._label_to_particle.get(label)
+        if particle is None:
+            # If the label is not indexed, compare positions
+            particle = next((p for p in self.particles if 'x' in p and 'y' in p
+                             and abs(p['x'] - label.x) < 1 and abs(p['y'] - label.y) < 1), None)
+
+        if particle is not None:
+            particle.update(new_data)
+            if 'name' in new_data:
+                self.add_used_name(new_data['name'])
 
         # Redraw particles to update visual representation
         self.draw_particles()
@@ -3171,11 +3417,9 @@ class CapillaryAnalyzer(QMainWindow):
         if self.capillary_height is None or self.ceiling_y is None or self.floor_y is None:
             return
 
-        capillary_pixels = abs(self.floor_y - self.ceiling_y)
-        for particle in self.particles:
-            particle_y = particle['y']
-            relative_height = (self.floor_y - particle_y) / capillary_pixels
-            particle['height'] = relative_height * self.capillary_height
+        heights = self.calculate_heights([(particle['x'], particle['y']) for particle in self.particles])
+        for particle, height in zip(self.particles, heights):
+            particle['height'] = height
 
             if 'label_item' in particle:
                 particle['label_item'].update_height(particle['height'])
@@ -3183,15 +3427,12 @@ class CapillaryAnalyzer(QMainWindow):
         self.set_unsaved_changes()
 
     def delete_particle(self, label):
-        for i, particle in enumerate(self.particles):
-            if particle['label_item'] == label:
-                self.scene.removeItem(particle['label_item'])
-                self.scene.removeItem(particle['dot_item'])
-                self.scene.removeItem(particle['line_item'])
-                del self.particles[i]
-                break
-
-        self.scene.update()
+        particle = self._label_to_particle.pop(label, None)
+        if particle is not None:
+            self.scene.removeItem(particle['label_item'])
+            self.scene.removeItem(particle['dot_item'])
+            self.scene.removeItem(particle['line_item'])
+            self.particles.remove(particle)
 
     def update_connection_lines(self):
         for particle in self.particles:
@@ -3203,8 +3444,23 @@ class CapillaryAnalyzer(QMainWindow):
                 line.setLine(QLineF(start, end))
 
     def add_used_name(self, name):
+        if name in self.used_names:
+            return
         self.used_names.add(name)
 
+        # Keep one reusable menu action per name so the context menu doesn't rebuild them
+        action = QAction(name, self)
+        action.setData(name)
+        self._name_actions.append(action)
+
+    def set_used_names(self, names):
+        for action in self._name_actions:
+            action.deleteLater()
+        self.used_names = set()
+        self._name_actions = []
+        for name in names:
+            self.add_used_name(name)
+
     def export_csv(self):
         if not self.check_image_loaded():
             self.show_toast("Nothing to export", message_type="warning", timeout=3000)
@@ -3216,29 +3472,53 @@ class CapillaryAnalyzer(QMainWindow):
         file_name, _ = QFileDialog.getSaveFileName(self, "Save CSV", "", "CSV Files (*.csv)")
         if file_name:
             try:
-                with open(file_name, 'w', newline='') as csvfile:
+                with open(file_name, 'w', newline='', buffering=1 << 20) as csvfile:
                     writer = csv.writer(csvfile)
                     writer.writerow(['Name', 'Height (µm)', 'Notes'])
-                    for particle in self.particles:
-                        writer.writerow([
-                            particle['name'],
-                            f"{particle['height']:.2f}",
-                            particle.get('notes', '') if BETA_FEATURES_ENABLED else ''
-                        ])
+                    writer.writerows(
+                        (particle['name'],
+                         f"{particle['height']:.2f}",
+                         particle.get('notes', '') if BETA_FEATURES_ENABLED else '')
+                        for particle in self.particles
+                    )
                 self.show_info_message("Export Successful", f"Data exported to {file_name}", buttons=['OK'])
             except Exception as e:
                 self.show_error_message("Export Error", f"Error exporting data: {str(e)}")
 
     def check_for_updates(self):
+        owner = "vxco"
+        repo = "PHASe"
+        url = f"https://api.github.com/repos/{owner}/{repo}/releases/latest"
+
+        # Fetch off the GUI thread so the window stays responsive while waiting on the network
+        self.update_check_thread = JsonFetchThread(url, self)
+        self.update_check_thread.fetched.connect(self.handle_latest_release)
+        self.update_check_thread.failed.connect(self.handle_update_check_failed)
+        self.update_check_thread.finished.connect(self.update_check_finished)
+        self.update_check_thread.finished.connect(self.update_check_thread.deleteLater)
+        self.update_check_thread.start()
+
+    def update_check_finished(self):
+        # Only forget the thread that just ended, a newer check may already be running
+        if self.sender() is self.update_check_thread:
+            self.update_check_thread = None
+
+    def wait_for_update_check(self, timeout_ms=2000):
+        thread = self.update_check_thread
+        if thread is None or not thread.isRunning():
+            return
+        # A result arriving now would open a dialog on a window that is going away
+        thread.fetched.disconnect(self.handle_latest_release)
+        thread.failed.disconnect(self.handle_update_check_failed)
+        # Qt aborts if a running QThread is destroyed with its parent window, give the request a short grace
+        # period and otherwise detach it, a stalled DNS lookup is not covered by the request timeout
+        if not thread.wait(timeout_ms):
+            thread.setParent(None)
+            detached_threads.append(thread)
+            thread.finished.connect(lambda: detached_threads.remove(thread))
+
+    def handle_latest_release(self, latest_release):
         try:
-            owner = "vxco"
-            repo = "PHASe"
-            url = f"https://api.github.com/repos/{owner}/{repo}/releases/latest"
-
-            response = requests.get(url)
-            response.raise_for_status()
-
-            latest_release = json.loads(response.text)
             latest_version = latest_release['tag_name'].lstrip('v')
 
             if version.parse(latest_version) > version.parse(CURRENT_VERSION):
@@ -3282,8 +3562,11 @@ class CapillaryAnalyzer(QMainWindow):
                 self.show_toast(message="You are using the latest version", message_type="info")
 
         except Exception as e:
-            self.show_error_message("Update Check Failed", f"Check your connection and retry.")
-            print(f"error message shown from function check_for_updates with exception: {e}")
+            self.handle_update_check_failed(str(e))
+
+    def handle_update_check_failed(self, error):
+        self.show_error_message("Update Check Failed", f"Check your connection and retry.")
+        print(f"error message shown from function check_for_updates with exception: {error}")
 
     def check_image_loaded(self):
         if not self.image_loaded:
@@ -3342,7 +3625,7 @@ class CapillaryAnalyzer(QMainWindow):
 
 
 def exception_hook(exctype, value, tb):
-    print(''.join(traceback.format_exception(exctype, value, tb)))
+    traceback.print_exception(exctype, value, tb, file=sys.stderr)
     sys.exit(1)
 
 
@@ -1,10 +1,13 @@
 import sys
 import os
+import queue
+import threading
 import requests
 import tempfile
 import zipfile
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QProgressBar, QLabel, QPushButton
 from PyQt5.QtCore import Qt, QThread, pyqtSignal
 
@@ -20,39 +23,113 @@ class UpdaterThread(QThread):
 
     def run(self):
         try:
-            # Download the update
+            # Download the update, small archives stay in memory and larger ones spill to disk
             self.update_progress.emit(10, "Downloading update...")
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.zip') as tmp_file:
+            with tempfile.SpooledTemporaryFile(max_size=64 << 20) as archive:
                 response = requests.get(self.download_url, stream=True)
                 total_size = int(response.headers.get('content-length', 0))
-                block_size = 1024
+                block_size = 128 * 1024
                 downloaded = 0
-                for data in response.iter_content(block_size):
-                    downloaded += len(data)
-                    tmp_file.write(data)
-                    if total_size:
-                        percent = int((downloaded / total_size) * 20)
-                        self.update_progress.emit(10 + percent, f"Downloading... {percent * 5}%")
-
-            self.update_progress.emit(30, "Extracting update...")
-            with tempfile.TemporaryDirectory() as extract_dir:
-                with zipfile.ZipFile(tmp_file.name, 'r') as zip_ref:
-                    zip_ref.extractall(extract_dir)
-
-                self.update_progress.emit(50, "Installing update...")
+                last_percent = -1
+
+                # A reader thread keeps the socket busy while this thread writes, at most four chunks in flight
+                chunks = queue.Queue(maxsize=4)
+                cancelled = threading.Event()
+                reader = threading.Thread(target=self.read_chunks, args=(response, block_size, chunks, cancelled),
+                                          daemon=True)
+                reader.start()
+                try:
+                    while True:
+                        data = chunks.get()
+                        if data is None:
+                            break
+                        if isinstance(data, Exception):
+                            raise data
+                        downloaded += len(data)
+                        archive.write(data)
+                        if total_size:
+                            # Only cross the thread boundary when the displayed progress actually moves
+                            percent = int((downloaded / total_size) * 20)
+                            if percent != last_percent:
+                                last_percent = percent
+                                self.update_progress.emit(10 + percent, f"Downloading... {percent * 5}%")
+                finally:
+                    # Stops the reader even when writing failed, closing the response ends iter_content
+                    cancelled.set()
+                    response.close()
+                    reader.join(timeout=1)
+
+                self.update_progress.emit(30, "Extracting update...")
                 app_name = os.path.basename(self.app_path)
-                new_app_path = os.path.join(extract_dir, app_name)
-
-                if not os.path.exists(new_app_path):
-                    raise Exception(f"Updated application not found in downloaded package: {new_app_path}")
-
-                if os.path.exists(self.app_path):
-                    shutil.rmtree(self.app_path)
-                shutil.move(new_app_path, self.app_path)
+                with tempfile.TemporaryDirectory() as extract_dir:
+                    archive.seek(0)
+                    with zipfile.ZipFile(archive, 'r') as zip_ref:
+                        # Only the application bundle is installed, skip everything else in the archive
+                        members = [info for info in zip_ref.infolist()
+                                   if info.filename.rstrip('/') == app_name
+                                   or info.filename.startswith(app_name + '/')]
+
+                        # Refuse the whole archive before writing anything if a member could land outside
+                        # extract_dir, the remaining names resolve to the same paths extract() writes to
+                        targets = {}
+                        for info in members:
+                            target = self.member_target(extract_dir, info.filename)
+                            if target is None:
+                                raise Exception(f"Unsafe path in downloaded package: {info.filename}")
+                            targets[info.filename] = target
+
+                        # Create the directory tree up front so the workers never race on mkdir
+                        files = []
+                        for info in members:
+                            target = targets[info.filename]
+                            if info.is_dir():
+                                os.makedirs(target, exist_ok=True)
+                            else:
+                                os.makedirs(os.path.dirname(target), exist_ok=True)
+                                files.append(info)
+
+                        # ZipFile serialises reads on the shared archive, inflating and writing run in parallel
+                        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+                            list(executor.map(lambda info: zip_ref.extract(info, extract_dir), files))
+
+                    self.update_progress.emit(50, "Installing update...")
+                    new_app_path = os.path.join(extract_dir, app_name)
+
+                    if not os.path.exists(new_app_path):
+                        raise Exception(f"Updated application not found in downloaded package: {new_app_path}")
+
+                    # Stage the new bundle beside the installed one, then swap with two renames
+                    incoming_path = self.app_path + '.incoming'
+                    backup_path = self.app_path + '.old'
+                    for stale_path in (incoming_path, backup_path):
+                        if os.path.exists(stale_path):
+                            shutil.rmtree(stale_path)
+                    shutil.move(new_app_path, incoming_path)
+
+                    if os.path.exists(self.app_path):
+                        os.rename(self.app_path, backup_path)
+                    try:
+                        os.rename(incoming_path, self.app_path)
+                    except OSError:
+                        if os.path.exists(backup_path):
+                            os.rename(backup_path, self.app_path)
+                        raise
+
+            # The new version is live, the old one can go
+            if os.path.exists(backup_path):
+                shutil.rmtree(backup_path, ignore_errors=True)
 
             self.update_progress.emit(90, "Finalizing...")
-            subprocess.run(['xattr', '-rc', self.app_path])
-            subprocess.run(['chmod', '-R', '755', self.app_path])
+            xattr_process = None
+            if sys.platform == 'darwin':
+                # Python has no xattr calls on macOS, the system tool clears quarantine flags
+                # while the permission walk below runs, they touch different metadata
+                xattr_process = subprocess.Popen(['xattr', '-rc', self.app_path])
+            try:
+                self.make_executable(self.app_path)
+            finally:
+                if xattr_process is not None:
+                    xattr_process.wait()
 
             self.update_progress.emit(100, "Update completed successfully!")
             self.update_finished.emit(True, "Update completed successfully! Please restart the application.")
@@ -60,9 +137,50 @@ class UpdaterThread(QThread):
         except Exception as e:
             self.update_finished.emit(False, f"Error during update: {str(e)}")
 
-        finally:
-            if 'tmp_file' in locals():
-                os.unlink(tmp_file.name)
+    @staticmethod
+    def member_target(extract_dir, filename):
+        # Absolute names, drive letters and parent references are rejected rather than rewritten
+        name = filename.replace('\\', '/')
+        parts = name.split('/')
+        if name.startswith('/') or os.path.splitdrive(name)[0] or parts[0].endswith(':') or '..' in parts:
+            return None
+        root = os.path.normpath(extract_dir)
+        target = os.path.normpath(os.path.join(root, *[part for part in parts if part not in ('', '.')]))
+        if os.path.commonpath([root, target]) != root:
+            return None
+        return target
+
+    @staticmethod
+    def read_chunks(response, block_size, chunks, cancelled):
+        def hand_over(item):
+            # Bounded waits so a writer that gave up never leaves this thread blocked on a full queue
+            while not cancelled.is_set():
+                try:
+                    chunks.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        # Network errors are handed to the writer so they surface from run()
+        try:
+            for data in response.iter_content(chunk_size=block_size):
+                if not hand_over(data):
+                    return
+        except Exception as e:
+            hand_over(e)
+        else:
+            hand_over(None)
+
+    @staticmethod
+    def make_executable(path):
+        # Same result as chmod -R 755 in one in-process walk, symlinks are left alone
+        os.chmod(path, 0o755)
+        for root, dirs, files in os.walk(path):
+            for name in dirs + files:
+                entry_path = os.path.join(root, name)
+                if not os.path.islink(entry_path):
+                    os.chmod(entry_path, 0o755)
 
 
 class UpdaterUI(QWidget):